@@ -0,0 +1,172 @@
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+
+from document_index import DEFAULT_INDEX_PATH, INDEXED_EXTENSIONS, DocumentIndex
+from hashing import file_hash, input_hash
+
+# Checkpoint manifest for bulk render jobs (CV's, klant-decks, presentatiekit).
+# Every finished item is appended as one JSON line, so a crashed run can be
+# restarted and only redoes the items that are missing, changed or damaged.
+
+MANIFEST_NAME = ".bulk_manifest.jsonl"
+
+# Rendering code every generator goes through; a change here changes the output
+# of every kit item, so it is part of their input hash
+SHARED_RENDER_MODULES = ("tenant_themes", "fragment_cache", "text_fit", "package_writer")
+
+
+class CheckpointManifest:
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Half-written last line from a crash: that item is simply redone
+                    continue
+                # Later lines win, so a re-rendered item replaces its old record
+                self.entries[entry["key"]] = entry
+
+    def is_complete(self, key, digest, output):
+        """Whether ``output`` (absolute) holds this item, rendered from ``digest``."""
+        entry = self.entries.get(key)
+        if entry is None or entry["input_hash"] != digest or entry["output"] != output:
+            return False
+        if not os.path.exists(output) or os.path.getsize(output) != entry["size"]:
+            return False
+        return file_hash(output) == entry["output_hash"]
+
+    def record(self, key, digest, output):
+        entry = {
+            "key": key,
+            "input_hash": digest,
+            "output": os.path.abspath(output),
+            "size": os.path.getsize(output),
+            "output_hash": file_hash(output),
+            "completed_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries[key] = entry
+
+
+def _render_item(render, payload, output):
+    base, ext = os.path.splitext(output)
+    tmp_output = f"{base}.partial{ext}"
+    try:
+        render(payload, tmp_output)
+        os.replace(tmp_output, output)
+    finally:
+        if os.path.exists(tmp_output):
+            os.remove(tmp_output)
+    # Only renders that opted into indexing have an entry to move
+    if output.lower().endswith(INDEXED_EXTENSIONS) and os.path.exists(DEFAULT_INDEX_PATH):
+        document_index = DocumentIndex()
+        document_index.move(tmp_output, output)
+        document_index.close()
+
+
+def run_bulk_job(items, render, output_dir, manifest_path=None, scheduler=None, tenant=None):
+    """Render (key, filename, payload) items, skipping everything already done.
+
+    ``render(payload, path)`` writes one output file. It first writes to a
+    temporary name that is renamed afterwards, so a crash never leaves a
+    half-written file behind under the final name.
+
+    With a RenderScheduler, every item is queued as a separate bulk-class
+    render, so interactive renders can go ahead between two items; ``tenant``
+    is the queue the items are fairly scheduled under.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest = CheckpointManifest(manifest_path or os.path.join(output_dir, MANIFEST_NAME))
+    lock = threading.Lock()
+
+    def complete(key, digest, payload, output):
+        _render_item(render, payload, output)
+        with lock:
+            manifest.record(key, digest, output)
+
+    futures = []
+    done = skipped = 0
+    for key, filename, payload in items:
+        digest = input_hash(payload)
+        output = os.path.abspath(os.path.join(output_dir, filename))
+        if manifest.is_complete(key, digest, output):
+            skipped += 1
+            continue
+
+        if scheduler is None:
+            complete(key, digest, payload, output)
+        else:
+            kwargs = {"queue_tenant": tenant} if tenant else {}
+            futures.append(scheduler.submit(complete, key, digest, payload, output, priority="bulk", **kwargs))
+        done += 1
+
+    for future in futures:
+        future.result()
+    print(f"Bulk job klaar: {done} gegenereerd, {skipped} overgeslagen (al compleet)")
+    return done, skipped
+
+
+def presentation_kit_items():
+    from generate_advisor_doc import create_document
+    from generate_click_script import create_click_script
+    from generate_full_script import create_full_script
+    from generate_playbook import create_playbook
+    from generate_presentation import create_presentation
+    from tenant_themes import DEFAULT_TENANT, load_theme
+    import presentation_content
+
+    kit = [
+        ("presentation", "Eindpresentatie_Stage_AVE_CRM_v3.pptx", create_presentation),
+        ("playbook", "Draaiboek_Eindpresentatie_AVE_CRM.docx", create_playbook),
+        ("click_script", "Volledig_Script_Met_Klikmomenten.docx", create_click_script),
+        ("full_script", "Volledig_Script_Eindpresentatie_AVE_CRM.docx", create_full_script),
+        ("business_case", "AVE_CRM_Business_Case.docx", create_document),
+    ]
+    # The content lives in presentation_content and the generator source, the
+    # styling in the theme and the shared rendering modules; together they make
+    # up the input hash
+    content_hash = file_hash(presentation_content.__file__)
+    shared_hashes = {
+        name: file_hash(importlib.import_module(name).__file__) for name in SHARED_RENDER_MODULES
+    }
+    theme_version = load_theme(DEFAULT_TENANT)["version"]
+    for key, filename, generator in kit:
+        source = sys.modules[generator.__module__].__file__
+        payload = {
+            "module": generator.__module__,
+            "function": generator.__name__,
+            "source_hash": file_hash(source),
+            "content_hash": content_hash,
+            "shared_hashes": shared_hashes,
+            "theme_version": theme_version,
+        }
+        yield key, filename, payload
+
+
+def render_generator(payload, path):
+    module = importlib.import_module(payload["module"])
+    getattr(module, payload["function"])(path)
+
+
+if __name__ == "__main__":
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else "output"
+    run_bulk_job(
+        presentation_kit_items(),
+        render_generator,
+        output_dir,
+    )
@@ -0,0 +1,210 @@
+import sys
+import tracemalloc
+from array import array
+
+# Memory-lean representations of generator input, for merges of hundreds of
+# thousands of records where per-object overhead (a dict per record, a str
+# object per bullet) is what fills up memory.
+#
+# - Slide: a slotted record instead of a dict per slide.
+# - ColumnStore: array-backed columns. Long texts are packed as UTF-8 into
+#   one bytearray with an offsets array; repeated strings (labels, times,
+#   style names) are stored once and referenced by a small integer code.
+#   Iterating yields plain tuples in the shape the renderers' helpers take,
+#   e.g. add_row(table, *row), so rows are materialized one at a time.
+
+
+class Slide:
+    """One slide of the presentation, with the entry for each kit target."""
+
+    __slots__ = ("deck", "playbook", "click_script", "full_script")
+
+    def __init__(self, deck, playbook, click_script, full_script):
+        self.deck = deck
+        self.playbook = playbook
+        self.click_script = click_script
+        self.full_script = full_script
+
+
+class TextColumn:
+    """Strings packed back to back as UTF-8, with an offset per row."""
+
+    __slots__ = ("_data", "_offsets")
+
+    def __init__(self):
+        self._data = bytearray()
+        self._offsets = array("Q", [0])
+
+    def append(self, value):
+        if not isinstance(value, str):
+            raise TypeError(f"TextColumn values must be str, not {type(value).__name__}")
+        self._data += value.encode("utf-8")
+        self._offsets.append(len(self._data))
+
+    def truncate(self, length):
+        del self._data[self._offsets[length]:]
+        del self._offsets[length + 1:]
+
+    def __getitem__(self, i):
+        return self._data[self._offsets[i]:self._offsets[i + 1]].decode("utf-8")
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+
+class LabelColumn:
+    """Repeated strings: each distinct value is kept once, rows store its code."""
+
+    __slots__ = ("_values", "_codes_by_value", "_codes")
+
+    def __init__(self):
+        self._values = []
+        self._codes_by_value = {}
+        self._codes = array("I")
+
+    def append(self, value):
+        code = self._codes_by_value.get(value)
+        if code is None:
+            # intern() first: it rejects non-strings before anything is stored
+            value = sys.intern(value)
+            code = len(self._values)
+            self._values.append(value)
+            self._codes_by_value[value] = code
+        self._codes.append(code)
+
+    def truncate(self, length):
+        # Distinct values stay; an unused one costs a single string
+        del self._codes[length:]
+
+    def __getitem__(self, i):
+        return self._values[self._codes[i]]
+
+    def __len__(self):
+        return len(self._codes)
+
+
+class ListColumn:
+    """A variable-length list of strings per row, flattened into one column."""
+
+    __slots__ = ("_items", "_offsets")
+
+    def __init__(self, items):
+        self._items = items
+        self._offsets = array("Q", [0])
+
+    def append(self, values):
+        try:
+            for value in values:
+                self._items.append(value)
+        except BaseException:
+            self._items.truncate(self._offsets[-1])
+            raise
+        self._offsets.append(len(self._items))
+
+    def truncate(self, length):
+        self._items.truncate(self._offsets[length])
+        del self._offsets[length + 1:]
+
+    def __getitem__(self, i):
+        return [self._items[j] for j in range(self._offsets[i], self._offsets[i + 1])]
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+
+COLUMN_KINDS = {
+    "text": TextColumn,
+    "label": LabelColumn,
+    "texts": lambda: ListColumn(TextColumn()),
+    "labels": lambda: ListColumn(LabelColumn()),
+}
+
+
+class ColumnStore:
+    """Append-only table of records, stored column by column.
+
+    ``fields`` is a sequence of (name, kind) with kind one of COLUMN_KINDS:
+    "text" for long, mostly unique strings, "label" for short repeated ones,
+    and "texts"/"labels" for a list of those per record.
+    """
+
+    def __init__(self, fields):
+        self.fields = tuple(name for name, _ in fields)
+        self._columns = tuple(COLUMN_KINDS[kind]() for _, kind in fields)
+
+    def append(self, *values):
+        """Add one record; on a bad value the store is left as it was."""
+        if len(values) != len(self._columns):
+            raise ValueError(f"Expected {len(self._columns)} values ({', '.join(self.fields)}), got {len(values)}")
+        length = len(self)
+        try:
+            for column, value in zip(self._columns, values):
+                column.append(value)
+        except BaseException:
+            # Roll back the columns that already took their value
+            for column in self._columns:
+                column.truncate(length)
+            raise
+
+    def extend(self, rows):
+        for row in rows:
+            self.append(*row)
+
+    def __len__(self):
+        return len(self._columns[0])
+
+    def __getitem__(self, i):
+        return tuple(column[i] for column in self._columns)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+
+# Playbook script rows: add_row(table, slide_title, key_message, bullet_points, time)
+PLAYBOOK_ROW_FIELDS = (
+    ("slide_title", "label"),
+    ("key_message", "text"),
+    ("bullet_points", "texts"),
+    ("time", "label"),
+)
+
+
+def _sample_rows(count):
+    # Realistic merge input: every row gets freshly built strings, as they
+    # would come out of a database or CSV, with a handful of repeated labels
+    for i in range(count):
+        yield (
+            f"{i % 13 + 1}. Slide",
+            f"Kernboodschap voor kandidaat {i}: relevante ervaring en beschikbaarheid.",
+            [f"Punt {j} voor kandidaat {i}, met toelichting voor de recruiter." for j in range(3)],
+            f"{i % 3}:30",
+        )
+
+
+def measure_peak_memory(count=100_000):
+    """Peak traced memory (bytes) of holding ``count`` playbook rows, both ways."""
+    results = {}
+    for name, build in (
+        ("list of tuples", lambda rows: list(rows)),
+        ("ColumnStore", lambda rows: _store_from(rows)),
+    ):
+        tracemalloc.start()
+        data = build(_sample_rows(count))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del data
+        results[name] = peak
+    return results
+
+
+def _store_from(rows):
+    store = ColumnStore(PLAYBOOK_ROW_FIELDS)
+    store.extend(rows)
+    return store
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    for name, peak in measure_peak_memory(count).items():
+        print(f"{name:15} piekgeheugen voor {count} records: {peak / 1024 / 1024:.1f} MB")
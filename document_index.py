@@ -0,0 +1,212 @@
+import argparse
+import math
+import os
+import re
+import sqlite3
+import sys
+import time
+import zipfile
+from collections import Counter
+
+from lxml import etree
+
+# Full-text index over generated and imported .docx/.pptx files, so finding
+# "which candidates did we propose to client X" is a lookup instead of opening
+# documents one by one. The index is an inverted index (term -> documents) in
+# SQLite; documents are re-tokenized only when their size or mtime changed.
+
+# Next to this module, like themes/, so every generator uses the same index
+# whatever directory it runs from
+DEFAULT_INDEX_PATH = os.environ.get(
+    "AVE_DOCUMENT_INDEX",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "document_index.sqlite"),
+)
+INDEXED_EXTENSIONS = (".docx", ".pptx")
+
+# Parts that hold the visible text of a document or deck
+TEXT_PART = re.compile(r"^(word/(document|header\d*|footer\d*)\.xml|ppt/(slides|notesSlides)/\w+\.xml)$")
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+PARAGRAPH_TAGS = ("{%s}p" % W_NS, "{%s}p" % A_NS)
+TEXT_TAGS = ("{%s}t" % W_NS, "{%s}t" % A_NS)
+TOKEN = re.compile(r"\w\w+")
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    length INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    doc_id INTEGER NOT NULL,
+    tf INTEGER NOT NULL,
+    PRIMARY KEY (term, doc_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+"""
+
+
+def extract_text(members):
+    """Plain text of the (name, xml blob) parts of a .docx/.pptx package."""
+    paragraphs = []
+    for name, blob in members:
+        if not TEXT_PART.match(name):
+            continue
+        root = etree.fromstring(blob)
+        for p in root.iter(*PARAGRAPH_TAGS):
+            # Runs split words at arbitrary points, so join them without spaces
+            text = "".join(t.text for t in p.iter(*TEXT_TAGS) if t.text)
+            if text:
+                paragraphs.append(text)
+    return "\n".join(paragraphs)
+
+
+def read_members(path):
+    with zipfile.ZipFile(path) as z:
+        return [(name, z.read(name)) for name in z.namelist() if TEXT_PART.match(name)]
+
+
+def tokenize(text):
+    return TOKEN.findall(text.casefold())
+
+
+class DocumentIndex:
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    def close(self):
+        self.db.close()
+
+    def add(self, path, members=None):
+        """(Re)index one file; ``members`` skips re-reading a file just written."""
+        path = os.path.abspath(path)
+        terms = Counter(tokenize(extract_text(members if members is not None else read_members(path))))
+        stat = os.stat(path)
+        with self.db:
+            self._remove(path)
+            cur = self.db.execute(
+                "INSERT INTO docs (path, mtime, size, length) VALUES (?, ?, ?, ?)",
+                (path, stat.st_mtime, stat.st_size, sum(terms.values())),
+            )
+            self.db.executemany(
+                "INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)",
+                ((term, cur.lastrowid, tf) for term, tf in terms.items()),
+            )
+
+    def _remove(self, path):
+        row = self.db.execute("SELECT id FROM docs WHERE path = ?", (path,)).fetchone()
+        if row:
+            self.db.execute("DELETE FROM postings WHERE doc_id = ?", row)
+            self.db.execute("DELETE FROM docs WHERE id = ?", row)
+
+    def remove(self, path):
+        with self.db:
+            self._remove(os.path.abspath(path))
+
+    def move(self, old_path, new_path):
+        # A renamed file keeps its postings
+        with self.db:
+            self._remove(os.path.abspath(new_path))
+            self.db.execute(
+                "UPDATE docs SET path = ? WHERE path = ?",
+                (os.path.abspath(new_path), os.path.abspath(old_path)),
+            )
+
+    def update_directory(self, directory):
+        """Index new and changed files below ``directory``; drop deleted ones."""
+        directory = os.path.abspath(directory)
+        # An exact prefix match: LIKE would treat '_' and '%' in the directory
+        # name as wildcards and ignore case, and the files it wrongly matched
+        # would be dropped from the index below
+        prefix = directory + os.sep
+        known = {
+            path: (mtime, size)
+            for path, mtime, size in self.db.execute(
+                "SELECT path, mtime, size FROM docs WHERE substr(path, 1, ?) = ?", (len(prefix), prefix)
+            )
+        }
+        added = 0
+        for root, _, files in os.walk(directory):
+            for name in files:
+                # Skip Office lock files such as "~$script.docx"
+                if not name.lower().endswith(INDEXED_EXTENSIONS) or name.startswith("~$"):
+                    continue
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                if known.pop(path, None) == (stat.st_mtime, stat.st_size):
+                    continue
+                try:
+                    self.add(path)
+                    added += 1
+                except (zipfile.BadZipFile, KeyError, etree.XMLSyntaxError) as e:
+                    print(f"Overgeslagen: {path} ({e})")
+        for path in known:
+            self.remove(path)
+        return added, len(known)
+
+    def search(self, query, limit=10):
+        """Return [(path, score)] ranked by BM25, best match first."""
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        n_docs, total_length = self.db.execute("SELECT COUNT(*), SUM(length) FROM docs").fetchone()
+        if not n_docs:
+            return []
+        avg_length = total_length / n_docs
+
+        scores = Counter()
+        for term in terms:
+            rows = self.db.execute(
+                "SELECT p.doc_id, p.tf, d.length FROM postings p JOIN docs d ON d.id = p.doc_id WHERE p.term = ?",
+                (term,),
+            ).fetchall()
+            if not rows:
+                continue
+            idf = math.log(1 + (n_docs - len(rows) + 0.5) / (len(rows) + 0.5))
+            for doc_id, tf, length in rows:
+                scores[doc_id] += idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * length / avg_length))
+
+        results = []
+        for doc_id, score in scores.most_common(limit):
+            path, = self.db.execute("SELECT path FROM docs WHERE id = ?", (doc_id,)).fetchone()
+            results.append((path, score))
+        return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Doorzoek gegenereerde en geïmporteerde .docx/.pptx bestanden.")
+    parser.add_argument("--index", default=DEFAULT_INDEX_PATH, help="pad naar het indexbestand")
+    sub = parser.add_subparsers(dest="command", required=True)
+    update = sub.add_parser("update", help="map (incrementeel) indexeren")
+    update.add_argument("directories", nargs="+")
+    search = sub.add_parser("search", help="zoeken in de index")
+    search.add_argument("query")
+    search.add_argument("-n", "--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    index = DocumentIndex(args.index)
+    if args.command == "update":
+        for directory in args.directories:
+            added, removed = index.update_directory(directory)
+            print(f"{directory}: {added} geïndexeerd, {removed} verwijderd")
+    else:
+        start = time.perf_counter()
+        results = index.search(args.query, args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+        for path, score in results:
+            print(f"{score:7.2f}  {path}")
+        print(f"{len(results)} resultaten in {elapsed:.1f} ms")
+    index.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+import copy
+import threading
+from collections import OrderedDict
+
+from hashing import input_hash
+from tenant_themes import DEFAULT_TENANT, new_document, theme_version
+
+# Cache of rendered document fragments. Blocks that recur across documents
+# (the playbook checklist and Q&A, the business case footer, the [KLIK] cue)
+# are built once with python-docx in a scratch document from the tenant
+# template; after that, inserting one is a deepcopy of the cached XML.
+#
+# The key covers the block name, the tenant and theme version (the styles the
+# XML refers to) and a hash of the content. Fragments must not refer to
+# relationships (images, hyperlinks), since those live outside the XML.
+
+
+class FragmentCache:
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._fragments = OrderedDict()
+        # Scheduler workers and kit renders share one cache
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def _render(self, build, content, tenant):
+        scratch = new_document(tenant)
+        body = scratch.element.body
+        build(scratch, content)
+        # Everything the builder added, minus the section properties
+        return [el for el in body if el is not body.sectPr]
+
+    def insert(self, doc, name, content, build, tenant=DEFAULT_TENANT):
+        """Append the fragment ``build(doc, content)`` would add to ``doc``."""
+        key = (name, tenant, theme_version(tenant), input_hash(content))
+        with self._lock:
+            elements = self._fragments.get(key)
+            if elements is not None:
+                self.hits += 1
+                self._fragments.move_to_end(key)
+
+        if elements is None:
+            # Rendered outside the lock; if two threads miss at once, both
+            # render and the last one stored wins, which is harmless
+            elements = self._render(build, content, tenant)
+            with self._lock:
+                self.misses += 1
+                self._fragments[key] = elements
+                if len(self._fragments) > self.maxsize:
+                    self._fragments.popitem(last=False)
+
+        body = doc.element.body
+        for el in elements:
+            # Keep sectPr last, like python-docx's own add_paragraph()
+            if body.sectPr is not None:
+                body.sectPr.addprevious(copy.deepcopy(el))
+            else:
+                body.append(copy.deepcopy(el))
+
+
+FRAGMENTS = FragmentCache()
@@ -1,15 +1,24 @@
-from docx import Document
-from docx.shared import Pt, RGBColor
+from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
-def create_document():
-    doc = Document()
+from fragment_cache import FRAGMENTS
+from package_writer import save_package
+from tenant_themes import DEFAULT_TENANT, new_document
 
-    # Stijlen definiëren
-    style = doc.styles['Normal']
-    font = style.font
-    font.name = 'Arial'
-    font.size = Pt(11)
+FOOTER_TEXT = "Vertrouwelijk document - Enkel voor intern gebruik en financieel advies."
+
+def add_footer(doc, text):
+    # Voetnoot
+    doc.add_paragraph()
+    footer = doc.add_paragraph(text)
+    footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    for run in footer.runs:
+        run.font.size = Pt(8)
+        run.italic = True
+
+def create_document(filename='AVE_CRM_Business_Case.docx', tenant=DEFAULT_TENANT):
+    # Stijlen (lettertype, huiskleur) komen uit het thema van de tenant
+    doc = new_document(tenant)
 
     # Titel
     title = doc.add_heading('Business Case: AVE CRM Platform', 0)
@@ -23,17 +32,11 @@ def create_document():
     info.add_run(' 30 januari 2026\n')
     info.alignment = WD_ALIGN_PARAGRAPH.RIGHT
 
-    def add_section(title_text, color):
-        h = doc.add_heading(title_text, level=1)
-        for run in h.runs:
-            run.font.color.rgb = color
-            run.font.size = Pt(14)
-
-    # Kleur: Donkerrood uit het project (#800400)
-    brand_color = RGBColor(128, 4, 0)
+    def add_section(title_text):
+        doc.add_paragraph(title_text, style='Sectiekop')
 
     # Sectie 1: Wat is AVE CRM?
-    add_section('1. Wat is AVE CRM?', brand_color)
+    add_section('1. Wat is AVE CRM?')
     p1 = doc.add_paragraph(
         "AVE CRM is een modern, cloud-based softwareplatform specifiek ontwikkeld voor de werving- en selectiebranche. "
         "Het systeem digitaliseert en automatiseert het volledige proces van kandidaat-bemiddeling: van het importeren "
@@ -46,7 +49,7 @@ def create_document():
     )
 
     # Sectie 2: Waarde voor AVE Services
-    add_section('2. Waarde voor AVE Services (Interne Business Case)', brand_color)
+    add_section('2. Waarde voor AVE Services (Interne Business Case)')
     
     bullets = [
         ("Efficiëntieslag door AI:", "Gebruik van Google Gemini & Vertex AI om automatisch CV's uit te lezen. Bespaart recruiters uren aan handmatig invoerwerk per week."),
@@ -62,7 +65,7 @@ def create_document():
         p.add_run(f" {normal_text}")
 
     # Sectie 3: Commerciële Potentie
-    add_section('3. Commerciële Potentie (Doorverkoop aan Derden)', brand_color)
+    add_section('3. Commerciële Potentie (Doorverkoop aan Derden)')
     
     bullets_comm = [
         ("Multi-Tenant Architectuur:", "Technisch gebouwd om eenvoudig nieuwe, afgeschermde omgevingen voor externe klanten op te starten (SaaS-model)."),
@@ -77,16 +80,11 @@ def create_document():
         run.bold = True
         p.add_run(f" {normal_text}")
 
-    # Voetnoot
-    doc.add_paragraph()
-    footer = doc.add_paragraph("Vertrouwelijk document - Enkel voor intern gebruik en financieel advies.")
-    footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    for run in footer.runs:
-        run.font.size = Pt(8)
-        run.italic = True
+    # Voetnoot (rendered once, then copied from the fragment cache)
+    FRAGMENTS.insert(doc, "business_case_footer", FOOTER_TEXT, add_footer, tenant)
 
-    doc.save('AVE_CRM_Business_Case.docx')
-    print("Document succesvol gegenereerd: AVE_CRM_Business_Case.docx")
+    save_package(doc, filename)
+    print(f"Document succesvol gegenereerd: {filename}")
 
 if __name__ == "__main__":
     create_document()
@@ -0,0 +1,18 @@
+import hashlib
+import json
+
+# Content hashes shared by the bulk-job manifest and the fragment cache.
+
+
+def input_hash(payload):
+    # Stable hash of the item input: same content -> same hash, key order irrelevant
+    data = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def file_hash(path, chunk_size=1024 * 1024):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
@@ -0,0 +1,199 @@
+import copy
+import os
+import posixpath
+import struct
+import sys
+import zipfile
+
+try:
+    from docx.oxml import parse_xml as parse_docx_xml
+    from docx.opc.oxml import serialize_part_xml
+    from pptx.oxml import parse_xml as parse_pptx_xml
+    from pptx.shapes.shapetree import SlideShapes
+except ImportError:
+    print("Error: 'python-docx' or 'python-pptx' module not found.")
+    print("Please install them using: pip install python-docx python-pptx")
+    sys.exit(1)
+
+from document_index import INDEXED_EXTENSIONS, DocumentIndex
+from generate_playbook import add_row, add_script_table
+from generate_presentation import fill_body
+from package_writer import append_raw_entry, resolve_compresslevel
+from tenant_themes import DEFAULT_TENANT, load_theme, new_document
+from text_fit import fit_text_frame, inherited_size
+
+# Patch mode for generated .pptx/.docx files: instead of rebuilding the whole
+# package, only the changed parts are re-serialized. Every other zip entry
+# (layouts, media, styles, ...) is copied over still compressed, so the cost
+# of an update follows the size of the change, not the size of the deck.
+
+NS = {
+    "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+    "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+}
+LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+DATA_DESCRIPTOR_SIG = b"PK\x07\x08"
+
+
+def _raw_entry(src, info):
+    # Local file header + compressed data (+ data descriptor) exactly as stored
+    src.seek(info.header_offset)
+    header = src.read(LOCAL_HEADER.size)
+    name_len, extra_len = LOCAL_HEADER.unpack(header)[-2:]
+    data = src.read(name_len + extra_len + info.compress_size)
+    if info.flag_bits & 0x08:
+        descriptor = src.read(16)
+        data += descriptor if descriptor[:4] == DATA_DESCRIPTOR_SIG else descriptor[:12]
+    return header + data
+
+
+def rewrite_package(path, replacements, output=None, compression="default", index=False):
+    """Write ``path`` to ``output`` with ``replacements`` ({part name: bytes}) applied.
+
+    Unchanged entries are copied byte for byte without decompressing them.
+    Without ``output`` the file is replaced in place (via a temporary file).
+    With ``index``, the result is re-indexed right away, as in save_package.
+    """
+    output = output or path
+    tmp_output = output + ".patching"
+    try:
+        with zipfile.ZipFile(path) as zin, open(path, "rb") as src, \
+                zipfile.ZipFile(tmp_output, "w", zipfile.ZIP_DEFLATED,
+                                compresslevel=resolve_compresslevel(compression)) as zout:
+            for info in zin.infolist():
+                if info.filename in replacements:
+                    zout.writestr(info.filename, replacements[info.filename])
+                    continue
+                append_raw_entry(zout, copy.copy(info), _raw_entry(src, info))
+        os.replace(tmp_output, output)
+    finally:
+        if os.path.exists(tmp_output):
+            os.remove(tmp_output)
+
+    if index and output.lower().endswith(INDEXED_EXTENSIONS):
+        document_index = DocumentIndex()
+        document_index.add(output)
+        document_index.close()
+
+
+def _rels_targets(zin, part_name):
+    folder, name = posixpath.split(part_name)
+    rels = parse_pptx_xml(zin.read(posixpath.join(folder, "_rels", name + ".rels")))
+    return {
+        rel.get("Id"): (rel.get("Type").rsplit("/", 1)[-1], posixpath.normpath(posixpath.join(folder, rel.get("Target"))))
+        for rel in rels.findall("rel:Relationship", NS)
+    }
+
+
+def _slide_part_names(zin):
+    # Slide order comes from presentation.xml, not from the part names
+    targets = _rels_targets(zin, "ppt/presentation.xml")
+    presentation = parse_pptx_xml(zin.read("ppt/presentation.xml"))
+    return [
+        targets[sld_id.get("{%s}id" % NS["r"])][1]
+        for sld_id in presentation.findall("p:sldIdLst/p:sldId", NS)
+    ]
+
+
+def _related_part(zin, part_name, rel_type):
+    for kind, target in _rels_targets(zin, part_name).values():
+        if kind == rel_type:
+            return target
+
+
+def _placeholder_chain(zin, slide_part, idx):
+    # Where the body placeholder has no size or font size of its own, it
+    # inherits them from the layout and, failing that, the master (matched by
+    # placeholder type)
+    layout_part = _related_part(zin, slide_part, "slideLayout")
+    master_part = _related_part(zin, layout_part, "slideMaster")
+    layout = parse_pptx_xml(zin.read(layout_part))
+    master = parse_pptx_xml(zin.read(master_part))
+    placeholders = (
+        layout.xpath(".//p:sp[p:nvSpPr/p:nvPr/p:ph[@idx='%d']]" % idx)
+        + master.xpath(".//p:sp[p:nvSpPr/p:nvPr/p:ph[@type='body']]")
+    )
+    return placeholders, master
+
+
+def _placeholder_extent(placeholders):
+    for sp in placeholders:
+        for ext in sp.xpath("./p:spPr/a:xfrm/a:ext"):
+            return int(ext.get("cx")), int(ext.get("cy"))
+    return None
+
+
+def _check_numbers(numbers, count, what):
+    # 1-based; 0 and negative numbers would otherwise index from the end
+    for number in numbers:
+        if not 1 <= number <= count:
+            raise ValueError(f"{what} {number} does not exist (expected 1..{count})")
+
+
+def patch_presentation(path, slides, output=None, tenant=DEFAULT_TENANT):
+    """Replace the title and body of the given slides of an existing deck.
+
+    ``slides`` maps 1-based slide numbers to ``(title, content)`` in the same
+    form as the ``deck`` entries of presentation_content: bullet points, or a
+    subtitle string for a title slide.
+    """
+    font = load_theme(tenant)["font"]
+    replacements = {}
+    with zipfile.ZipFile(path) as zin:
+        part_names = _slide_part_names(zin)
+        _check_numbers(slides, len(part_names), "Slide")
+        for number, (title, content) in slides.items():
+            part_name = part_names[number - 1]
+            sld = parse_pptx_xml(zin.read(part_name))
+            shapes = SlideShapes(sld.cSld.spTree, None)
+            shapes.title.text = title
+
+            body_shape = next(s for s in shapes if s.is_placeholder and s.placeholder_format.idx == 1)
+            tf = body_shape.text_frame
+            # Same dispatch as PresentationWriter.write
+            if isinstance(content, str):
+                tf.text = content
+            else:
+                tf.clear()
+                fill_body(tf, content)
+                # The slide's own placeholder first, then the ones it inherits from
+                inherited, master = _placeholder_chain(zin, part_name, 1)
+                placeholders = [body_shape._element] + inherited
+                fit_text_frame(
+                    body_shape, family=font,
+                    max_size=inherited_size(placeholders, master),
+                    extent=_placeholder_extent(placeholders),
+                )
+            replacements[part_name] = serialize_part_xml(sld)
+
+    rewrite_package(path, replacements, output)
+    print(f"Patched {len(replacements)} slide(s) in '{output or path}'")
+
+
+def patch_playbook(path, rows, output=None, tenant=DEFAULT_TENANT):
+    """Replace rows of the script table in an existing playbook.
+
+    ``rows`` maps 1-based row numbers (header not counted) to the
+    ``(slide_title, key_message, bullet_points, time)`` arguments of ``add_row``.
+    """
+    # New rows are rendered in a scratch document built from the same tenant
+    # template, so style ids and column widths match the original table
+    scratch_table = add_script_table(new_document(tenant))
+
+    with zipfile.ZipFile(path) as zin:
+        document = parse_docx_xml(zin.read("word/document.xml"))
+    tbl = document.find(".//w:tbl", NS)
+    table_rows = tbl.findall("w:tr", NS)
+    # Row 0 is the header
+    _check_numbers(rows, len(table_rows) - 1, "Row")
+    for number, args in rows.items():
+        add_row(scratch_table, *args)
+        new_row = scratch_table.rows[-1]._tr
+        table_rows[number].addprevious(new_row)
+        tbl.remove(table_rows[number])
+
+    rewrite_package(path, {"word/document.xml": serialize_part_xml(document)}, output)
+    print(f"Patched {len(rows)} row(s) in '{output or path}'")
@@ -0,0 +1,139 @@
+import os
+import sys
+import time
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    from docx.opc.package import OpcPackage as DocxPackage
+    from docx.opc.pkgwriter import PackageWriter as DocxPackageWriter
+    from pptx.opc.serialized import PackageWriter as PptxPackageWriter
+except ImportError:
+    print("Error: 'python-docx' or 'python-pptx' module not found.")
+    print("Please install them using: pip install python-docx python-pptx")
+    sys.exit(1)
+
+# Drop-in replacement for doc.save() / prs.save(): the parts are serialized by
+# python-docx/python-pptx as usual, but deflated on a thread pool (zlib
+# releases the GIL) and parts that deflate barely shrinks are stored as-is.
+
+COMPRESSION_LEVELS = {
+    "fastest": 1,
+    "fast": 3,
+    "default": 6,
+    "smallest": 9,
+}
+
+# A part is stored uncompressed when deflate keeps more than this share of it
+STORE_RATIO = 0.9
+
+# Usually compressed already. Large parts of these types are probed with a
+# sample first, so a video is not deflated in full just to find that out; small
+# ones (e.g. the template's thumbnail.jpeg, which deflate does shrink) are
+# simply compressed and compared like any other part.
+COMPRESSED_EXTENSIONS = {
+    ".jpeg", ".jpg", ".png", ".gif", ".tif", ".tiff", ".wdp",
+    ".mp3", ".m4a", ".mp4", ".m4v", ".mov", ".wmv",
+    ".emz", ".wmz", ".zip", ".gz",
+}
+PROBE_SIZE = 64 * 1024
+
+
+class _MemberCollector:
+    # Stands in for the libraries' physical package writer and keeps the
+    # serialized members in package order instead of writing them to a zip
+    def __init__(self):
+        self.members = []
+
+    def write(self, pack_uri, blob):
+        self.members.append((pack_uri.membername, blob))
+
+
+def _serialize_members(package):
+    collector = _MemberCollector()
+    if isinstance(package, DocxPackage):
+        parts = package.parts
+        for part in parts:
+            part.before_marshal()
+        DocxPackageWriter._write_content_types_stream(collector, parts)
+        DocxPackageWriter._write_pkg_rels(collector, package.rels)
+        DocxPackageWriter._write_parts(collector, parts)
+    else:
+        writer = PptxPackageWriter(None, package._rels, tuple(package.iter_parts()))
+        writer._write_content_types_stream(collector)
+        writer._write_pkg_rels(collector)
+        writer._write_parts(collector)
+    return collector.members
+
+
+def _deflate(blob, level):
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    return compressor.compress(blob) + compressor.flush()
+
+
+def _probably_incompressible(name, blob):
+    if len(blob) <= PROBE_SIZE or os.path.splitext(name)[1].lower() not in COMPRESSED_EXTENSIONS:
+        return False
+    sample = blob[:PROBE_SIZE]
+    return len(_deflate(sample, 1)) > len(sample) * STORE_RATIO
+
+
+def _compress_member(name, blob, level, date_time):
+    info = zipfile.ZipInfo(name, date_time)
+    info.external_attr = 0o600 << 16
+    info.file_size = len(blob)
+    info.CRC = zlib.crc32(blob)
+    data = None if _probably_incompressible(name, blob) else _deflate(blob, level)
+    if data is None or len(data) > len(blob) * STORE_RATIO:
+        info.compress_type = zipfile.ZIP_STORED
+        data = blob
+    else:
+        info.compress_type = zipfile.ZIP_DEFLATED
+    info.compress_size = len(data)
+    return info, info.FileHeader() + data
+
+
+def append_raw_entry(zout, info, raw):
+    """Append an already compressed entry (local header + data) to ``zout``."""
+    # zipfile has no public raw-write API: write the bytes and register the
+    # entry so it ends up in the central directory
+    info.header_offset = zout.fp.tell()
+    zout.fp.write(raw)
+    zout.start_dir = zout.fp.tell()
+    zout.filelist.append(info)
+    zout.NameToInfo[info.filename] = info
+
+
+def resolve_compresslevel(compression):
+    if isinstance(compression, str):
+        return COMPRESSION_LEVELS[compression]
+    return compression
+
+
+def save_package(doc, path, compression="default", max_workers=None, index=False):
+    """Save a python-docx Document or python-pptx Presentation to ``path``.
+
+    ``compression`` is a deflate level (1-9) or one of COMPRESSION_LEVELS;
+    lower is faster, higher is smaller. With ``index``, a file saved to a path
+    is added to the full-text index right away; otherwise the next
+    ``document_index.py update`` picks it up.
+    """
+    level = resolve_compresslevel(compression)
+    members = _serialize_members(doc.part.package)
+    date_time = time.localtime()[:6]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        compressed = pool.map(lambda m: _compress_member(m[0], m[1], level, date_time), members)
+        with zipfile.ZipFile(path, "w") as zout:
+            for info, raw in compressed:
+                append_raw_entry(zout, info, raw)
+
+    if index and isinstance(path, (str, os.PathLike)):
+        # Imported here so plain saves do not load the index (and sqlite3)
+        from document_index import DocumentIndex
+
+        # The XML is still in memory, so indexing does not re-read the file
+        document_index = DocumentIndex()
+        document_index.add(path, members)
+        document_index.close()
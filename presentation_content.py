@@ -0,0 +1,499 @@
+# Content of the final presentation, shared by all presentation kit targets:
+# the deck, the playbook (draaiboek), the click script and the full script.
+# One Slide record per slide; each target reads its own entry, with the
+# same arguments as the helper that renders it.
+
+from compact_content import Slide
+
+SLIDES = [
+    Slide(
+        # Title slide: the deck shows a subtitle instead of bullets
+        deck=("Eindpresentatie Stage AVE CRM", "Van Legacy naar SaaS: Professionalisering van Recruitment Software\n\nStijn van der Neut\n19 Januari 2026"),
+        playbook=(
+            "1. Titel",
+            "Welkom & Introductie.",
+            [
+                "Welkom heten (Hugo, begeleiders, collega's).",
+                "Kort voorstellen: Stijn van der Neut, student HBO-ICT.",
+                "Titel toelichten: Vandaag neem ik jullie mee in de transformatie van AVE Consultancy."
+            ],
+            "0:30"
+        ),
+        click_script=(
+            "Titel Slide",
+            [
+                "Goedemorgen allemaal. Welkom bij mijn eindpresentatie.",
+                "Mijn naam is Stijn van der Neut en de afgelopen 20 weken heb ik mij beziggehouden met de digitale transformatie van AVE Consultancy.",
+                "Vandaag neem ik jullie mee in de reis van een klassieke, analoge werkwijze naar een modern, digitaal SaaS-platform.",
+                "Ik vertel jullie niet alleen WAT ik heb gebouwd, maar vooral WAAROM, en hoe ik mijzelf tijdens dit proces heb ontwikkeld van student naar professional.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "Titel Slide",
+            "Goedemorgen allemaal. Welkom bij mijn eindpresentatie.\n\n"
+            "Mijn naam is Stijn van der Neut en de afgelopen 20 weken heb ik mij beziggehouden met de digitale transformatie van AVE Consultancy. "
+            "Vandaag neem ik jullie mee in de reis van een klassieke, analoge werkwijze naar een modern, digitaal SaaS-platform. "
+            "Ik vertel jullie niet alleen WAT ik heb gebouwd, maar vooral WAAROM, en hoe ik mijzelf tijdens dit proces heb ontwikkeld van student naar professional."
+        ),
+    ),
+    Slide(
+        deck=("Agenda", [
+            "Situatieschets & Aanleiding",
+            "Opdracht, Scope & Tijdsframe",
+            "Probleemstelling",
+            "Onderzoek (Build vs Buy)",
+            "De Oplossing (Tech Stack)",
+            "Diepgang: Multi-Tenancy",
+            "Diepgang: AI Bulk Import",
+            "Persoonlijke Ontwikkeling",
+            "Toekomstvisie"
+        ]),
+        playbook=(
+            "2. Agenda",
+            "Structuur bieden.",
+            [
+                "Kort de punten nalopen.",
+                "Benadrukken: Eerst de business context, dan de techniek, dan persoonlijke groei.",
+                "Meld dat vragen aan het einde mogen (of tussendoor, wat je fijn vindt)."
+            ],
+            "0:30"
+        ),
+        click_script=(
+            "Agenda",
+            [
+                "Om structuur te geven aan het verhaal, beginnen we bij de basis: de situatie zoals ik die aantrof.",
+                "Daarna kijken we naar het probleem dat daaruit voortkwam en het onderzoek dat ik heb gedaan.",
+                "Vervolgens duiken we de diepte in: ik laat jullie de oplossing zien en we bespreken twee technische hoogtepunten: Multi-Tenancy en AI.",
+                "Ik sluit af met een persoonlijke reflectie op mijn leerproces en een blik op de toekomst.",
+                "Vragen mogen tussendoor als ze dringend zijn, maar voor de flow bewaar ik ze het liefst voor het einde.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "Agenda",
+            "Om structuur te geven aan het verhaal, beginnen we bij de basis: de situatie zoals ik die aantrof. "
+            "Daarna kijken we naar het probleem dat daaruit voortkwam en het onderzoek dat ik heb gedaan. "
+            "Vervolgens duiken we de diepte in: ik laat jullie de oplossing zien en we bespreken twee technische hoogtepunten: Multi-Tenancy en AI. "
+            "Ik sluit af met een persoonlijke reflectie op mijn leerproces en een blik op de toekomst.\n\n"
+            "Vragen mogen tussendoor als ze dringend zijn, maar voor de flow bewaar ik ze het liefst voor het einde."
+        ),
+    ),
+    Slide(
+        deck=("Situatieschets & Aanleiding", [
+            ("Organisatie:", "AVE Consultancy: Headhuntingbureau met groeiambitie."),
+            ("Oude Situatie:", "Versnipperde data in Dropbox mappen.", "Klantgegevens in losse Excel sheets.", "Communicatie in individuele mailboxen."),
+            ("Het Gevolg:", "Geen centraal inzicht.", "Tijdrovende zoektochten naar informatie.")
+        ]),
+        playbook=(
+            "3. Situatie",
+            "De chaos van Excel/Dropbox.",
+            [
+                "AVE is een ambitieus bureau, maar de systemen liepen achter.",
+                "Beschrijf de oude situatie: 'Bestanden in Dropbox, lijsten in Excel, communicatie via losse mails'.",
+                "Het gevolg: Geen inzicht. Wie heeft welke kandidaat gesproken? Alles zat in hoofden van mensen."
+            ],
+            "2:00"
+        ),
+        click_script=(
+            "Situatieschets & Aanleiding",
+            [
+                "Laten we teruggaan naar september. AVE Consultancy is een succesvol headhuntingbureau met de ambitie om te groeien.",
+                "Maar als we onder de motorkap keken, zagen we dat de bedrijfsprocessen die ambitie niet konden bijbenen.",
+                "De situatie was als volgt: informatie stond versnipperd. CV's stonden in mappen op Dropbox, klantgegevens in verschillende Excel-lijsten en communicatie zat vast in de mailboxen van individuele medewerkers.",
+                "Het gevolg was simpel maar pijnlijk: Er was geen centraal inzicht. Als Adriaan wilde weten: 'Welke kandidaten hebben we voorgesteld aan Klant X?', dan was dat een zoektocht van soms wel een uur.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "Situatieschets & Aanleiding",
+            "Laten we teruggaan naar september. AVE Consultancy is een succesvol headhuntingbureau met de ambitie om te groeien. "
+            "Maar als we onder de motorkap keken, zagen we dat de bedrijfsprocessen die ambitie niet konden bijbenen.\n\n"
+            "De situatie was als volgt: informatie stond versnipperd. CV's stonden in mappen op Dropbox, klantgegevens in verschillende Excel-lijsten en communicatie zat vast in de mailboxen van individuele medewerkers. "
+            "Er was geen centraal brein. Als Adriaan wilde weten: 'Welke kandidaten hebben we voorgesteld aan Klant X?', dan was dat een zoektocht van soms wel een uur."
+        ),
+    ),
+    Slide(
+        deck=("Opdracht, Scope & Tijdsframe", [
+            ("De Opdracht:", "Ontwikkel een toekomstbestendige fundering.", "Doel: SaaS-platform (Software as a Service)."),
+            ("Tijdsframe:", "20 weken (September - Januari)."),
+            ("Scope (MVP):", "Focus op Relatiebeheer (CRM).", "Kandidaten, Klanten en Opdrachten.", "Out-of-scope: Facturatie & Mobile App.")
+        ]),
+        playbook=(
+            "4. Opdracht",
+            "SaaS & MVP.",
+            [
+                "De vraag van Adriaan: 'Bouw een fundering voor de toekomst'.",
+                "Niet zomaar een database, maar een SaaS-platform (Software as a Service).",
+                "Scope: 20 weken. Focus op de kern: Relaties (CRM) en Kandidaten.",
+                "Financiën en App vallen buiten scope."
+            ],
+            "1:00"
+        ),
+        click_script=(
+            "Opdracht, Scope & Tijdsframe",
+            [
+                "Dat moest anders. De opdracht die ik kreeg was helder, maar uitdagend: 'Ontwikkel een fundering voor de toekomst'.",
+                "Niet zomaar een database, maar een SaaS-platform (Software as a Service) waarmee AVE niet alleen zelf kan werken, maar dat in de toekomst ook aan andere bureaus verkocht kan worden.",
+                "Ik had 20 weken de tijd. We hebben daarom een strakke scope bepaald voor een MVP (Minimum Viable Product).",
+                "De focus lag op de kern van het vak: Relaties beheren. Kandidaten, Klanten en de Opdrachten daartussen.",
+                "Zaken als facturatie of een mobiele app hebben we bewust buiten beschouwing gelaten om kwaliteit te kunnen garanderen.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "Opdracht, Scope & Tijdsframe",
+            "Dat moest anders. De opdracht die ik kreeg was helder, maar uitdagend: 'Ontwikkel een fundering voor de toekomst'. "
+            "Niet zomaar een database, maar een SaaS-platform (Software as a Service) waarmee AVE niet alleen zelf kan werken, maar dat in de toekomst ook aan andere bureaus verkocht kan worden.\n\n"
+            "Ik had 20 weken de tijd. We hebben daarom een strakke scope bepaald voor een MVP (Minimum Viable Product). "
+            "De focus lag op de kern van het vak: Relaties beheren. Kandidaten, Klanten en de Opdrachten daartussen. "
+            "Zaken als facturatie of een mobiele app hebben we bewust buiten beschouwing gelaten om kwaliteit te kunnen garanderen."
+        ),
+    ),
+    Slide(
+        deck=("Probleemstelling", [
+            ("1. Inefficiëntie:", "Handmatige verwerking kost dagen."),
+            ("2. Risico (GDPR/AVG):", "Excel-lijsten mailen is onveilig.", "Persoonsgegevens verspreid over laptops."),
+            ("3. Gebrek aan Inzicht:", "Geen relaties in data.", "Niet kunnen sturen op cijfers.")
+        ]),
+        playbook=(
+            "5. Probleem",
+            "Waarom is dit erg?",
+            [
+                "Business pijn: Handmatig 3500 CV's verwerken kost maanden.",
+                "Risico: GDPR (AVG). Excel sheetjes mailen is niet veilig.",
+                "Technisch: Geen relaties. Je weet in Excel niet dat Kandidaat X bij Klant Y op gesprek is geweest."
+            ],
+            "1:30"
+        ),
+        click_script=(
+            "Probleemstelling",
+            [
+                "Waarom was die oude situatie nu zo problematisch? Ik heb dit samengevat in drie punten.",
+                "Ten eerste: Inefficiëntie. Het handmatig verwerken van honderden CV's kostte letterlijk dagen werk.",
+                "Ten tweede: Risico. We werken met persoonsgegevens. Excel-lijstjes heen en weer mailen is in 2026 echt niet meer AVG-proof.",
+                "En ten derde: Gebrek aan inzicht. Zonder relaties in je data kun je niet sturen op cijfers. Je vaart blind.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "Probleemstelling",
+            "Waarom was die oude situatie nu zo problematisch? \n"
+            "Ten eerste: Inefficiëntie. Het handmatig verwerken van honderden CV's kostte letterlijk dagen werk.\n"
+            "Ten tweede: Risico. We werken met persoonsgegevens. Excel-lijstjes heen en weer mailen is in 2026 echt niet meer AVG-proof.\n"
+            "En ten derde: Gebrek aan inzicht. Zonder relaties in je data kun je niet sturen op cijfers. Je vaart blind."
+        ),
+    ),
+    Slide(
+        deck=("Onderzoek: Build vs Buy", [
+            ("Optie A: Enterprise (Bullhorn/Salesforce)", "Extreem duur & complex voor start-up.", "Lange implementatietijd."),
+            ("Optie B: HR Software (Recruitee)", "Gericht op HR-afdelingen, niet op bureaus.", "Mist 'makelaarsfunctie' (Kandidaat <-> Klant)."),
+            ("Conclusie (Gap-analyse):", "Maatwerk is noodzakelijk.", "Eigendom van data & proces is cruciaal.")
+        ]),
+        playbook=(
+            "6. Onderzoek",
+            "Waarom niet kopen?",
+            [
+                "Belangrijkste slide voor school (Software Adviseren/Analyseren).",
+                "Ik heb gekeken naar Bullhorn (te duur/complex) en Recruitee (focus op HR, niet bureaus).",
+                "Conclusie Gap-analyse: Er was niets dat én betaalbaar was, én specifiek voor bureaus, én SaaS-ready.",
+                "Daarom: Maatwerk (Build vs Buy beslissing)."
+            ],
+            "2:30"
+        ),
+        click_script=(
+            "Onderzoek (Build vs Buy)",
+            [
+                "Als HBO-professional ga je niet meteen bouwen. Je gaat eerst analyseren. Moeten we dit wel zelf maken?",
+                "Ik heb volgens de DSR-methode gekeken naar de markt en zag twee smaken:",
+                "Optie A: De Enterprise giganten zoals Bullhorn of Salesforce. Geweldig, maar extreem duur en complex om in te richten voor een klein bureau.",
+                "Optie B: Systemen zoals Recruitee. Betaalbaar, maar die zijn gemaakt voor HR-afdelingen, niet voor bureaus die 'makelen' tussen partijen.",
+                "De conclusie was duidelijk: Er is een 'gap' in de markt. Maatwerk was de enige manier om de specifieke werkwijze van AVE te ondersteunen én eigenaar te blijven van de data.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "Onderzoek (Build vs Buy)",
+            "Als HBO-professional ga je niet meteen bouwen. Je gaat eerst analyseren. Moeten we dit wel zelf maken?\n\n"
+            "Ik heb volgens de DSR-methode (Design Science Research) gekeken naar de markt. We zagen twee smaken:\n"
+            "Aan de ene kant de Enterprise giganten zoals Bullhorn of Salesforce. Geweldig, maar extreem duur en complex om in te richten voor een klein bureau.\n"
+            "Aan de andere kant systemen zoals Recruitee. Betaalbaar, maar die zijn gemaakt voor HR-afdelingen, niet voor bureaus die 'makelen' tussen partijen.\n\n"
+            "De conclusie was duidelijk: Er is een 'gap' in de markt. Maatwerk was de enige manier om de specifieke werkwijze van AVE te ondersteunen én eigenaar te blijven van de data."
+        ),
+    ),
+    Slide(
+        deck=("De Oplossing: Tech Stack", [
+            ("Backend:", "Laravel 12 (PHP) - Wereldwijde standaard, veilig & stabiel."),
+            ("Frontend:", "React 19 - Snel, modern, 'app-gevoel'."),
+            ("Storage:", "Cloudflare R2 - Veilige, goedkope opslag voor CV's.")
+        ]),
+        playbook=(
+            "7. Oplossing",
+            "De Tech Stack.",
+            [
+                "High-level overview.",
+                "Backend: Laravel (PHP) - Bewezen, veilig, snel.",
+                "Frontend: React - Modern, snel, app-gevoel.",
+                "Opslag: Cloudflare R2 - Goedkoper dan AWS, sneller dan lokale disk."
+            ],
+            "1:00"
+        ),
+        click_script=(
+            "De Oplossing (Tech Stack)",
+            [
+                "Dus zijn we gaan bouwen. Ik heb gekozen voor een robuuste, moderne tech stack.",
+                "Aan de achterkant draait Laravel (PHP). Dit is de wereldwijde standaard voor SaaS-applicaties: veilig en stabiel.",
+                "Aan de voorkant zien de gebruikers een React applicatie. Dit zorgt voor die snelle, 'snappy' ervaring die je verwacht van moderne software.",
+                "Voor de opslag van die duizenden CV's gebruiken we Cloudflare R2. Dat is net zo goed als Amazon S3, maar een stuk goedkoper en sneller.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "De Oplossing (Tech Stack)",
+            "Dus zijn we gaan bouwen. Ik heb gekozen voor een robuuste, moderne tech stack.\n\n"
+            "Aan de achterkant (Backend) draait Laravel (PHP). Dit is de wereldwijde standaard voor SaaS-applicaties: veilig en stabiel.\n"
+            "Aan de voorkant (Frontend) zien de gebruikers een React applicatie. Dit zorgt voor die snelle, 'snappy' ervaring die je verwacht van moderne software, zonder dat de pagina steeds moet herladen.\n"
+            "Voor de opslag van die duizenden CV's gebruiken we Cloudflare R2. Dat is net zo goed als Amazon S3, maar een stuk goedkoper en sneller."
+        ),
+    ),
+    Slide(
+        deck=("Diepgang: Multi-Tenancy (Veiligheid)", [
+            ("Vraag:", "Hoe scheiden we data van verschillende klanten?"),
+            ("Strategie: Database-per-Tenant", "Fysiek gescheiden databases per klant.", "100% Data-isolatie."),
+            ("Werking:", "Domein (klant.avecrm.nl) bepaalt de database.", "Veiligheid 'by design' (fouten in code lekken geen data).")
+        ]),
+        playbook=(
+            "8. Multi-Tenancy",
+            "Technische Diepgang 1.",
+            [
+                "Hoe garanderen we veiligheid als we meerdere klanten op 1 systeem hebben?",
+                "Strategie: 'Database per Tenant'.",
+                "Leg uit: Klant A heeft Database A. Klant B heeft Database B.",
+                "Fysiek gescheiden. Zelfs als de code faalt, kan Klant A nooit data van Klant B zien."
+            ],
+            "2:30"
+        ),
+        click_script=(
+            "Diepgang 1: Multi-Tenancy",
+            [
+                "Dan nu de technische diepgang. Want hoe zorg je er in een SaaS-omgeving voor dat Klant A nooit de data van Klant B ziet?",
+                "Ik heb gekozen voor een 'Database-per-Tenant' strategie. Dit is de meest veilige optie.",
+                "Iedere klant die inlogt, krijgt zijn eigen, fysiek gescheiden database.",
+                "Het systeem kijkt naar het domein, bijvoorbeeld 'klant-a.avecrm.nl', en weet dan: ik mag alléén verbinden met Database A.",
+                "Zelfs als ik als programmeur een fout maak in de code, is het technisch onmogelijk om data van de verkeerde klant op te halen. Veiligheid 'by design' dus.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "Diepgang 1: Multi-Tenancy",
+            "Dan nu de technische diepgang. Want hoe zorg je er in een SaaS-omgeving voor dat Klant A nooit de data van Klant B ziet?\n\n"
+            "Ik heb gekozen voor een 'Database-per-Tenant' strategie. Dit is de meest veilige optie. \n"
+            "Iedere klant die inlogt, krijgt zijn eigen, fysiek gescheiden database. \n"
+            "Het systeem kijkt naar het domein, bijvoorbeeld 'klant-a.avecrm.nl', en weet dan: ik mag alléén verbinden met Database A.\n"
+            "Zelfs als ik als programmeur een fout maak in de code, is het technisch onmogelijk om data van de verkeerde klant op te halen. Veiligheid 'by design' dus."
+        ),
+    ),
+    Slide(
+        deck=("Diepgang: AI Bulk Import", [
+            ("Uitdaging:", "3500+ Oude CV's digitaliseren."),
+            ("Oplossing:", "Google Gemini 3 Pro Pipeline."),
+            ("Proces:", "1. Upload PDF -> 2. AI Leest & Begrijpt -> 3. Opslaan in Database."),
+            ("Resultaat:", "Van 15 min/CV naar secondenwerk.", "Direct doorzoekbare database.")
+        ]),
+        playbook=(
+            "9. AI Import",
+            "Technische Diepgang 2 (Wow-factor).",
+            [
+                "Probleem: Die 3500 oude CV's.",
+                "Oplossing: AI (Gemini 3 Pro) leest de CV's.",
+                "Demo-achtig vertellen: 'Het systeem pakt een PDF, leest hem, snapt wat een Skill is, en stopt het in de database'.",
+                "Winst: Van 15 min per CV naar secondenwerk."
+            ],
+            "2:30"
+        ),
+        click_script=(
+            "Diepgang 2: AI Bulk Import",
+            [
+                "Het tweede technische hoogtepunt loste ons grootste probleem op: De historie. We hadden 3500 oude CV's in mapjes.",
+                "Ik heb een AI-pipeline gebouwd met Google Gemini 3 Pro.",
+                "Het werkt zo: Je sleept 100 CV's in het systeem. De server pakt ze op, en de AI 'leest' ze als een mens.",
+                "Hij haalt de naam, e-mail, skills en werkervaring eruit en stopt dit netjes in de database.",
+                "Wat vroeger 15 minuten per CV kostte aan typewerk, gebeurt nu in enkele seconden. Dit is de ware kracht van digitalisering.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "Diepgang 2: AI Bulk Import",
+            "Het tweede technische hoogtepunt loste ons grootste probleem op: De historie. We hadden 3500 oude CV's in mapjes.\n\n"
+            "Ik heb een AI-pipeline gebouwd met Google Gemini 3 Pro.\n"
+            "Het werkt zo: Je sleept 100 CV's in het systeem. De server pakt ze op, en de AI 'leest' ze als een mens.\n"
+            "Hij haalt de naam, e-mail, skills en werkervaring eruit en stopt dit netjes in de database.\n"
+            "Wat vroeger 15 minuten per CV kostte aan typewerk, gebeurt nu in enkele seconden. Dit is de ware kracht van digitalisering.",
+            "Als je een video/demo hebt, start die hier."
+        ),
+    ),
+    Slide(
+        deck=("Reflectie: Veerkracht & Eerlijkheid", [
+            ("De Tegenslag:", "Sprint 4: Dataverlies door crash & geen backups.", "Eerste reactie: Paniek & terugtrekken ('Oestergedrag')."),
+            ("Het Herstel:", "Eerlijk opgebiecht aan begeleider.", "Direct Automated Backup script gebouwd."),
+            ("De Les:", "Fouten maken mag, verzwijgen niet.", "Transparantie bouwt vertrouwen.")
+        ]),
+        playbook=(
+            "10. Tegenslag",
+            "Reflectie & Eerlijkheid.",
+            [
+                "Het moment van de 'Crash': Dataverlies door geen backups.",
+                "Eerlijk zijn: Ik schoot in de stress ('Oestergedrag').",
+                "De wending: Ik heb het eerlijk opgebiecht en direct een oplossing gebouwd (Automated Backups).",
+                "Les: Fouten maken mag, verzwijgen niet."
+            ],
+            "2:00"
+        ),
+        click_script=(
+            "Reflectie: Veerkracht",
+            [
+                "Tijdens dit project ging niet alles vlekkeloos. En daar wil ik eerlijk over zijn.",
+                "Halverwege de stage, in Sprint 4, crashte mijn ontwikkelomgeving. Omdat ik geen goede backups had, was ik een week werk kwijt.",
+                "Mijn eerste reactie was paniek. Ik trok me terug, het zogenoemde 'oestergedrag'. Ik dacht: ik los dit wel alleen op.",
+                "Maar ik leerde dat dat niet werkt. Ik heb het opgebiecht aan mijn begeleider. In plaats van boosheid, kreeg ik hulp.",
+                "Ik heb diezelfde dag nog een geautomatiseerd backup-script geschreven. De les die ik meeneem: Fouten maken mag, zolang je erover communiceert en het oplost.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "Persoonlijke Ontwikkeling (Veerkracht)",
+            "Tijdens dit project ging niet alles vlekkeloos. En daar wil ik eerlijk over zijn.\n\n"
+            "Halverwege de stage, in Sprint 4, crashte mijn ontwikkelomgeving. Omdat ik geen goede backups had, was ik een week werk kwijt.\n"
+            "Mijn eerste reactie was paniek. Ik trok me terug, het zogenoemde 'oestergedrag'. Ik dacht: ik los dit wel alleen op.\n"
+            "Maar ik leerde dat dat niet werkt. Ik heb het opgebiecht aan mijn begeleider. In plaats van boosheid, kreeg ik hulp.\n"
+            "Ik heb diezelfde dag nog een geautomatiseerd backup-script geschreven. \n"
+            "De les die ik meeneem: Fouten maken mag, zolang je erover communiceert en het oplost."
+        ),
+    ),
+    Slide(
+        deck=("Reflectie: Van Student naar Professional", [
+            ("Start:", "Afwachtend: 'Wat moet ik doen?'"),
+            ("Nu:", "Proactief: 'Hier is het plan voor de migratie'.", "Zelfstandig meetings & planning beheerd."),
+            ("Rol:", "Strategisch Partner (Adviseur & Bouwer).")
+        ]),
+        playbook=(
+            "11. Prof. Groei",
+            "Van Student naar Professional.",
+            [
+                "Begin: Afwachtend. 'Zeg maar wat ik moet doen'.",
+                "Einde: Proactief. 'Ik heb een plan gemaakt voor de migratie'.",
+                "Refereer aan feedback Hugo/Adriaan: 'Strategisch partner'."
+            ],
+            "1:30"
+        ),
+        click_script=(
+            "Reflectie: Professionaliteit",
+            [
+                "Als ik kijk naar de Stijn van 20 weken geleden, zie ik een afwachtende student. Ik vroeg: 'Wat moet ik doen?'.",
+                "Nu sta ik hier als professional. Ik wacht niet meer af, ik stel voor.",
+                "Ik heb zelf de wekelijkse meetings opgezet, ik beheer de planning en ik adviseer Adriaan over technische keuzes.",
+                "Zoals in de feedback van Hugo stond: Ik heb de rol gepakt van 'Strategisch Partner'.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "Persoonlijke Ontwikkeling (Professionaliteit)",
+            "Als ik kijk naar de Stijn van 20 weken geleden, zie ik een afwachtende student. Ik vroeg: 'Wat moet ik doen?'\n\n"
+            "Nu sta ik hier als professional. Ik wacht niet meer af, ik stel voor. \n"
+            "Ik heb zelf de wekelijkse meetings opgezet, ik beheer de planning en ik adviseer Adriaan over technische keuzes.\n"
+            "Zoals in de feedback van Hugo stond: Ik heb de rol gepakt van 'Strategisch Partner'."
+        ),
+    ),
+    Slide(
+        deck=("Toekomstvisie & Roadmap", [
+            ("Nu:", "Livegang MVP & Interne 'Dogfooding'."),
+            ("Binnenkort:", "Outlook Agenda Integratie (Microsoft Graph)."),
+            ("Lange termijn:", "Commercialisering naar andere bureaus (SaaS).")
+        ]),
+        playbook=(
+            "12. Toekomst",
+            "Hoe nu verder?",
+            [
+                "Het stopt hier niet.",
+                "Nu: Livegang MVP.",
+                "Straks: 'Dogfooding' (Zelf gebruiken) en Outlook integratie.",
+                "Droom: Dit platform verkopen aan andere bureaus."
+            ],
+            "1:00"
+        ),
+        click_script=(
+            "Toekomstvisie",
+            [
+                "En nu? De stage stopt, maar het product leeft.",
+                "De MVP gaat live. We gaan het systeem nu intern gebruiken ('Dogfooding') om de laatste puntjes op de i te zetten.",
+                "De volgende stap is de koppeling met Outlook, zodat ook de agenda's gesynchroniseerd zijn.",
+                "En op de lange termijn staat de weg open om dit platform in de markt te zetten voor andere bureaus.",
+                "[KLIK]"
+            ]
+        ),
+        full_script=(
+            "Toekomstvisie",
+            "En nu? De stage stopt, maar het product leeft.\n\n"
+            "De MVP gaat live. We gaan het systeem nu intern gebruiken ('Dogfooding') om de laatste puntjes op de i te zetten.\n"
+            "De volgende stap is de koppeling met Outlook, zodat ook de agenda's gesynchroniseerd zijn.\n"
+            "En op de lange termijn staat de weg open om dit platform in de markt te zetten voor andere bureaus."
+        ),
+    ),
+    Slide(
+        deck=("Conclusie", [
+            "Resultaat:", "Van analoge chaos naar digitaal fundament.", "Veilig, schaalbaar & slim (AI).", "Bewezen groei als professional.",
+            "",
+            "Bedankt voor uw aandacht. Zijn er nog vragen?"
+        ]),
+        playbook=(
+            "13. Conclusie",
+            "Afronding.",
+            [
+                "Samenvatten: We gingen van chaos naar structuur.",
+                "Ik heb laten zien dat ik kan Analyseren, Ontwerpen en Bouwen.",
+                "Bedankje richting Adriaan/Hugo voor de kans.",
+                "Vragenronde openen."
+            ],
+            "0:30"
+        ),
+        click_script=(
+            "Conclusie",
+            [
+                "Samenvattend: We zijn in 20 weken van een analoge chaos naar een gestructureerd, digitaal fundament gegaan.",
+                "Er staat een veilig systeem, er is een slimme AI-oplossing en ik heb mijzelf ontwikkeld tot een zelfstandige developer.",
+                "Ik wil Adriaan en mijn begeleiders bedanken voor het vertrouwen.",
+                "Dit was mijn presentatie. Zijn er nog vragen?"
+            ]
+        ),
+        full_script=(
+            "Conclusie",
+            "Samenvattend: We zijn in 20 weken van een analoge chaos naar een gestructureerd, digitaal fundament gegaan.\n"
+            "Er staat een veilig systeem, er is een slimme AI-oplossing en ik heb mijzelf ontwikkeld tot een zelfstandige developer.\n\n"
+            "Ik wil Adriaan en mijn begeleiders bedanken voor het vertrouwen.\n"
+            "Dit was mijn presentatie. Zijn er nog vragen?"
+        ),
+    ),
+]
+
+CHECKLIST = [
+    "Laptop aansluiten op scherm (HDMI/USB-C).",
+    "Presentatie openen in 'Presenter View' (zodat je notities ziet).",
+    "Zorg dat de demo-omgeving (localhost) draait voor het geval er vragen zijn.",
+    "Glas water klaarzetten.",
+    "Telefoon op 'Niet storen'.",
+    "Ademhaling check: Rustig in, rustig uit. Je bent de expert van dit project."
+]
+
+QA_LIST = [
+    ("Waarom heb je niet gewoon Salesforce gebruikt?", 
+     "Dat heb ik onderzocht. Salesforce is geweldig, maar de licentiekosten voor een starter zijn hoog en de implementatietijd is lang. Voor de specifieke wensen van AVE (snel, simpel, bureau-gericht) was maatwerk op lange termijn goedkoper en effectiever."),
+    
+    ("Is AI wel veilig met persoonsgegevens?", 
+     "Goede vraag. We gebruiken de Enterprise API van Google (Vertex AI/Gemini). De data wordt verwerkt in Europa (regio europe-west4) en Google gebruikt deze data *niet* om hun modellen te trainen. Dit is contractueel vastgelegd."),
+    
+    ("Wat gebeurt er als je weggaat? Wie onderhoudt dit?", 
+     "De code is volledig gedocumenteerd en gebouwd op standaarden (Laravel/React). Elke professionele PHP-ontwikkelaar kan dit overnemen. Daarnaast ligt er een technische overdrachtsdocumentatie."),
+    
+    ("Waarom Database-per-tenant? Dat is toch duur?", 
+     "In opslagruimte valt dat mee, structuur is klein. Het levert vooral enorme veiligheidswinst op. Bij één gedeelde database is één vergeten 'WHERE client_id = ...' al een datalek. Nu is dat fysiek onmogelijk.")
+]
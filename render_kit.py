@@ -0,0 +1,79 @@
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from generate_click_script import ClickScriptWriter
+from generate_full_script import FullScriptWriter
+from generate_playbook import PlaybookWriter
+from generate_presentation import PresentationWriter
+from presentation_content import SLIDES
+from tenant_themes import DEFAULT_TENANT, TEMPLATE_KINDS, compiled_template, theme_version
+
+# Renders the complete presentation kit (deck, playbook, click script, full
+# script) from presentation_content, every target in its own process.
+#
+# This is not a single pass over the slides: each target process walks them
+# for its own writer. Building a document is pure-Python work that holds the
+# GIL, so one walk feeding all four writers can only run them one after
+# another, and then the kit takes as long as all targets together. Walking the
+# (small, in-memory) slides once per process costs next to nothing; building
+# the targets side by side brings the kit down to about its slowest target,
+# given a core per target. On a single core the targets run in-process.
+
+KIT = [
+    (PresentationWriter, "Eindpresentatie_Stage_AVE_CRM_v3.pptx"),
+    (PlaybookWriter, "Draaiboek_Eindpresentatie_AVE_CRM.docx"),
+    (ClickScriptWriter, "Volledig_Script_Met_Klikmomenten.docx"),
+    (FullScriptWriter, "Volledig_Script_Eindpresentatie_AVE_CRM.docx"),
+]
+
+
+def render_target(writer_cls, tenant, slides, path):
+    writer = writer_cls(tenant)
+    for number, record in enumerate(slides, 1):
+        writer.write(number, record)
+    # Some targets add closing sections after the last slide
+    if hasattr(writer, "finish"):
+        writer.finish()
+    writer.save(path)
+    return path
+
+
+def _process_context():
+    # Never fork this process: it may already run RenderScheduler threads.
+    # The forkserver imports this module (and python-docx/python-pptx) once,
+    # so the workers forked from it do not; where there is none (Windows),
+    # every worker is spawned and imports them itself.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["render_kit"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+def render_kit(output_dir=".", tenant=DEFAULT_TENANT, slides=SLIDES):
+    slides = list(slides)
+    os.makedirs(output_dir, exist_ok=True)
+    targets = [(cls, os.path.join(output_dir, filename)) for cls, filename in KIT]
+
+    workers = min(len(targets), os.cpu_count() or 1)
+    if workers == 1:
+        return [render_target(cls, tenant, slides, path) for cls, path in targets]
+
+    # Compile the tenant templates to disk first, so the workers only read them
+    version = theme_version(tenant)
+    for kind in TEMPLATE_KINDS:
+        compiled_template(tenant, version, kind)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_process_context()) as pool:
+        futures = [pool.submit(render_target, cls, tenant, slides, path) for cls, path in targets]
+        # result() re-raises the first failure of any target
+        return [future.result() for future in futures]
+
+
+if __name__ == "__main__":
+    start = time.perf_counter()
+    render_kit(sys.argv[1] if len(sys.argv) > 1 else ".")
+    print(f"Presentatiekit gegenereerd in {time.perf_counter() - start:.2f}s")
@@ -0,0 +1,132 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+
+from tenant_themes import DEFAULT_TENANT
+
+# Scheduler in front of the generators for mixed workloads: a recruiter who
+# needs one document now should not wait behind an overnight bulk run.
+#
+# - Priority classes: a worker always takes the highest class with work.
+# - Fair queuing: within a class, tenants take turns (round robin), so one
+#   tenant's bulk job cannot starve another tenant's.
+# - Preemption at item boundaries: bulk jobs are submitted item by item, so an
+#   interactive render starts as soon as a worker finishes its current item.
+# - Queue-wait latency (submit -> start) is recorded per class.
+
+PRIORITY_CLASSES = ("interactive", "normal", "bulk")
+LATENCY_SAMPLES = 10000
+
+
+class RenderScheduler:
+    def __init__(self, workers=2):
+        self._cond = threading.Condition()
+        # class -> OrderedDict(tenant -> deque of tasks); the first tenant is next in turn
+        self._queues = {cls: OrderedDict() for cls in PRIORITY_CLASSES}
+        self._waits = {cls: deque(maxlen=LATENCY_SAMPLES) for cls in PRIORITY_CLASSES}
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=self._worker, name=f"render-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def submit(self, fn, *args, priority="interactive", queue_tenant=DEFAULT_TENANT, **kwargs):
+        """Queue ``fn(*args, **kwargs)``; returns a concurrent.futures.Future.
+
+        ``queue_tenant`` is only the fair-queuing key. It is not passed to
+        ``fn``, so a ``tenant=`` for the generator goes in ``kwargs`` as usual.
+        """
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority class '{priority}', expected one of {PRIORITY_CLASSES}")
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Cannot submit to a scheduler that has been shut down")
+            tenants = self._queues[priority]
+            tenants.setdefault(queue_tenant, deque()).append((future, fn, args, kwargs, time.perf_counter()))
+            self._cond.notify()
+        return future
+
+    def submit_bulk(self, fn, items, queue_tenant=DEFAULT_TENANT):
+        """Queue ``fn(item)`` for every item as separate bulk-class renders."""
+        return [self.submit(fn, item, priority="bulk", queue_tenant=queue_tenant) for item in items]
+
+    def _next_task(self):
+        for cls in PRIORITY_CLASSES:
+            tenants = self._queues[cls]
+            if tenants:
+                tenant, tasks = next(iter(tenants.items()))
+                task = tasks.popleft()
+                # Send this tenant to the back of the line (or drop it when done)
+                del tenants[tenant]
+                if tasks:
+                    tenants[tenant] = tasks
+                return cls, task
+        return None
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                while True:
+                    next_task = self._next_task()
+                    if next_task is not None or self._closed:
+                        break
+                    self._cond.wait()
+            if next_task is None:
+                return
+
+            cls, (future, fn, args, kwargs, submitted) = next_task
+            if not future.set_running_or_notify_cancel():
+                continue
+            with self._cond:
+                self._waits[cls].append(time.perf_counter() - submitted)
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def pending(self):
+        with self._cond:
+            return {cls: sum(len(q) for q in tenants.values()) for cls, tenants in self._queues.items()}
+
+    def latency_stats(self):
+        """Queue-wait latency per class in milliseconds (count, mean, p50, p95, max)."""
+        stats = {}
+        with self._cond:
+            samples = {cls: sorted(waits) for cls, waits in self._waits.items()}
+        for cls, waits in samples.items():
+            if not waits:
+                continue
+            stats[cls] = {
+                "count": len(waits),
+                "mean_ms": 1000 * sum(waits) / len(waits),
+                "p50_ms": 1000 * waits[len(waits) // 2],
+                "p95_ms": 1000 * waits[min(len(waits) - 1, int(len(waits) * 0.95))],
+                "max_ms": 1000 * waits[-1],
+            }
+        return stats
+
+    def report(self):
+        for cls, s in self.latency_stats().items():
+            print(
+                f"{cls:12} n={s['count']:<6} wachttijd gem {s['mean_ms']:.1f} ms, "
+                f"p50 {s['p50_ms']:.1f} ms, p95 {s['p95_ms']:.1f} ms, max {s['max_ms']:.1f} ms"
+            )
+
+    def shutdown(self, wait=True):
+        """Stop accepting work; queued renders still run before workers exit."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
@@ -0,0 +1,214 @@
+import functools
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+import zipfile
+
+try:
+    from docx import Document
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.shared import Inches, Pt, RGBColor
+    from pptx import Presentation
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.util import Inches as PptxInches
+    from lxml import etree
+except ImportError:
+    print("Error: 'python-docx' or 'python-pptx' module not found.")
+    print("Please install them using: pip install python-docx python-pptx")
+    sys.exit(1)
+
+from package_writer import save_package
+
+# Per-tenant branding (colors, font, logo). A theme pack in themes/<tenant>.json
+# is compiled once into a .dotx/.potx base template; generators start from that
+# template, so branding lives in the styles and is never applied run by run.
+# Compiled templates are kept in an LRU cache keyed by tenant and theme version:
+# bump "version" in the theme file and the next render compiles a new one.
+
+THEMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "themes")
+COMPILED_DIR = os.path.join(THEMES_DIR, "compiled")
+DEFAULT_TENANT = "ave"
+# Tenant names end up in file paths, so nothing that could leave themes/
+TENANT_NAME = re.compile(r"[a-z0-9_-]+")
+
+A_NS = {"a": "http://schemas.openxmlformats.org/drawingml/2006/main"}
+
+CT_DOCX_MAIN = "application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"
+CT_DOTX_MAIN = "application/vnd.openxmlformats-officedocument.wordprocessingml.template.main+xml"
+CT_PPTX_MAIN = "application/vnd.openxmlformats-officedocument.presentationml.presentation.main+xml"
+CT_POTX_MAIN = "application/vnd.openxmlformats-officedocument.presentationml.template.main+xml"
+
+# kind -> (template extension, main content type in use, main content type as template)
+TEMPLATE_KINDS = {
+    "docx": (".dotx", CT_DOCX_MAIN, CT_DOTX_MAIN),
+    "pptx": (".potx", CT_PPTX_MAIN, CT_POTX_MAIN),
+}
+
+
+def check_tenant(tenant):
+    if not isinstance(tenant, str) or not TENANT_NAME.fullmatch(tenant):
+        raise ValueError(f"Invalid tenant name {tenant!r}: expected lowercase letters, digits, '_' or '-'")
+    return tenant
+
+
+def theme_path(tenant):
+    check_tenant(tenant)
+    return os.path.join(THEMES_DIR, f"{tenant}.json")
+
+
+def load_theme(tenant):
+    with open(theme_path(tenant), encoding="utf-8") as f:
+        theme = json.load(f)
+    if theme.get("logo"):
+        theme["logo"] = os.path.join(THEMES_DIR, theme["logo"])
+    return theme
+
+
+@functools.lru_cache(maxsize=None)
+def _theme_version(tenant, mtime_ns):
+    return load_theme(tenant)["version"]
+
+
+def theme_version(tenant):
+    # Only re-read the theme file when it changed on disk
+    return _theme_version(tenant, os.stat(theme_path(tenant)).st_mtime_ns)
+
+
+def rgb(hex_color):
+    return RGBColor.from_string(hex_color)
+
+
+def _compile_docx(theme):
+    doc = Document()
+    styles = doc.styles
+
+    normal_style = styles["Normal"]
+    normal = normal_style.font
+    normal.name = theme["font"]
+    normal.size = Pt(theme["font_size"])
+
+    styles["Heading 2"].font.color.rgb = rgb(theme["accent_color"])
+
+    # Section headings of the business case; other documents keep plain Heading 1
+    section = styles.add_style("Sectiekop", WD_STYLE_TYPE.PARAGRAPH)
+    section.base_style = styles["Heading 1"]
+    section.next_paragraph_style = normal_style
+    section.font.color.rgb = rgb(theme["primary_color"])
+    section.font.size = Pt(14)
+
+    # Character styles for the recurring colored runs in the generators
+    kern = styles.add_style("Kern", WD_STYLE_TYPE.CHARACTER).font
+    kern.bold = True
+    kern.color.rgb = rgb(theme["accent_color"])
+
+    klik = styles.add_style("Klik", WD_STYLE_TYPE.CHARACTER).font
+    klik.bold = True
+    klik.size = Pt(12)
+    klik.color.rgb = rgb(theme["cue_color"])
+
+    actie = styles.add_style("Actie", WD_STYLE_TYPE.CHARACTER).font
+    actie.bold = True
+    actie.italic = True
+    actie.color.rgb = rgb(theme["cue_color"])
+
+    if theme.get("logo"):
+        header = doc.sections[0].header
+        header.paragraphs[0].add_run().add_picture(theme["logo"], width=Inches(1.2))
+    return doc
+
+
+def _compile_pptx(theme):
+    prs = Presentation()
+    master = prs.slide_master
+
+    # Theme fonts and accent colors drive every layout and placeholder
+    theme_part = master.part.part_related_by(RT.THEME)
+    theme_xml = etree.fromstring(theme_part.blob)
+    for latin in theme_xml.xpath("a:themeElements/a:fontScheme/*/a:latin", namespaces=A_NS):
+        latin.set("typeface", theme["font"])
+    for slot, key in (("accent1", "primary_color"), ("accent2", "accent_color"), ("dk2", "accent_color")):
+        color = theme_xml.xpath(f"a:themeElements/a:clrScheme/a:{slot}", namespaces=A_NS)[0]
+        color.clear()
+        etree.SubElement(color, "{%s}srgbClr" % A_NS["a"], val=theme[key])
+    theme_part.blob = etree.tostring(theme_xml, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+    if theme.get("logo"):
+        # Masters have no add_picture(); use the same calls it makes on slides
+        image_part, rId = master.part.get_or_add_image_part(theme["logo"])
+        width = PptxInches(1.2)
+        height = int(width * image_part.image.size[1] / image_part.image.size[0])
+        master.shapes._spTree.add_pic(
+            master.shapes._next_shape_id, "Logo", "", rId,
+            prs.slide_width - width - PptxInches(0.3), PptxInches(0.2), width, height,
+        )
+    return prs
+
+
+def _with_main_content_type(package, old, new):
+    # .dotx/.potx only differ from .docx/.pptx in the main part's content type
+    out = io.BytesIO()
+    with zipfile.ZipFile(io.BytesIO(package)) as zin, \
+            zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as zout:
+        for info in zin.infolist():
+            data = zin.read(info.filename)
+            if info.filename == "[Content_Types].xml":
+                data = data.replace(old.encode("utf-8"), new.encode("utf-8"))
+            zout.writestr(info, data)
+    return out.getvalue()
+
+
+def compiled_template_path(tenant, version, kind):
+    check_tenant(tenant)
+    return os.path.join(COMPILED_DIR, f"{tenant}-v{version}{TEMPLATE_KINDS[kind][0]}")
+
+
+@functools.lru_cache(maxsize=32)
+def compiled_template(tenant, version, kind):
+    """Package bytes of the tenant's base template, ready to open as a document.
+
+    Compiles the theme on first use and writes the .dotx/.potx next to the
+    theme files; later processes pick that file up instead of recompiling.
+    """
+    _, ct_main, ct_template = TEMPLATE_KINDS[kind]
+    path = compiled_template_path(tenant, version, kind)
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            return _with_main_content_type(f.read(), ct_template, ct_main)
+
+    theme = load_theme(tenant)
+    doc = _compile_docx(theme) if kind == "docx" else _compile_pptx(theme)
+    buffer = io.BytesIO()
+    save_package(doc, buffer)
+    package = buffer.getvalue()
+
+    # Write under a temporary name first: another thread or process that
+    # finds the final path must never read a half-written template
+    os.makedirs(COMPILED_DIR, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=COMPILED_DIR, suffix=".tmp", delete=False) as f:
+        f.write(_with_main_content_type(package, ct_main, ct_template))
+    os.replace(f.name, path)
+    return package
+
+
+def new_document(tenant=DEFAULT_TENANT):
+    """A python-docx Document based on the tenant's compiled template."""
+    version = theme_version(tenant)
+    return Document(io.BytesIO(compiled_template(tenant, version, "docx")))
+
+
+def new_presentation(tenant=DEFAULT_TENANT):
+    """A python-pptx Presentation based on the tenant's compiled template."""
+    version = theme_version(tenant)
+    return Presentation(io.BytesIO(compiled_template(tenant, version, "pptx")))
+
+
+if __name__ == "__main__":
+    # Pre-compile templates, e.g. after editing a theme: python tenant_themes.py ave
+    for tenant in sys.argv[1:] or [DEFAULT_TENANT]:
+        version = load_theme(tenant)["version"]
+        for kind in TEMPLATE_KINDS:
+            compiled_template(tenant, version, kind)
+            print(f"Compiled '{compiled_template_path(tenant, version, kind)}'")
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+from docx import Document
+
+from document_index import DocumentIndex
+
+
+def write_docx(path, text):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    doc = Document()
+    doc.add_paragraph(text)
+    doc.save(path)
+
+
+@pytest.fixture
+def index(tmp_path):
+    document_index = DocumentIndex(str(tmp_path / "index.sqlite"))
+    yield document_index
+    document_index.close()
+
+
+def test_update_and_search(tmp_path, index):
+    write_docx(str(tmp_path / "docs" / "a.docx"), "Kernboodschap voor de klant")
+    write_docx(str(tmp_path / "docs" / "b.docx"), "Iets anders")
+
+    assert index.update_directory(str(tmp_path / "docs")) == (2, 0)
+    assert index.update_directory(str(tmp_path / "docs")) == (0, 0)
+    assert [os.path.basename(path) for path, _ in index.search("kernboodschap")] == ["a.docx"]
+
+
+def test_removed_file_is_dropped(tmp_path, index):
+    path = str(tmp_path / "docs" / "a.docx")
+    write_docx(path, "Kernboodschap")
+    index.update_directory(str(tmp_path / "docs"))
+
+    os.remove(path)
+
+    assert index.update_directory(str(tmp_path / "docs")) == (0, 1)
+    assert index.search("kernboodschap") == []
+
+
+@pytest.mark.parametrize("indexed, updated", [
+    ("outX1", "out_1"),  # '_' is a LIKE wildcard
+    ("out1", "out%"),  # so is '%'
+    ("docs", "Docs"),  # LIKE ignores ASCII case
+])
+def test_update_only_touches_its_own_directory(tmp_path, index, indexed, updated):
+    write_docx(str(tmp_path / indexed / "a.docx"), "Kernboodschap")
+    index.update_directory(str(tmp_path / indexed))
+    os.makedirs(str(tmp_path / updated))
+
+    assert index.update_directory(str(tmp_path / updated)) == (0, 0)
+    assert len(index.search("kernboodschap")) == 1
@@ -0,0 +1,90 @@
+import os
+import zipfile
+
+import pytest
+from docx import Document
+from pptx import Presentation
+
+from generate_playbook import create_playbook
+from generate_presentation import create_presentation
+from package_patch import patch_playbook, patch_presentation, rewrite_package
+
+
+def assert_valid_package(path):
+    with zipfile.ZipFile(path) as z:
+        assert z.testzip() is None
+
+
+def unchanged_entries(before, after, changed):
+    with zipfile.ZipFile(before) as a, zipfile.ZipFile(after) as b:
+        assert a.namelist() == b.namelist()
+        return [name for name in a.namelist() if name not in changed and a.read(name) != b.read(name)]
+
+
+def test_patch_presentation_round_trip(tmp_path):
+    original = str(tmp_path / "deck.pptx")
+    patched = str(tmp_path / "deck-patched.pptx")
+    create_presentation(original)
+
+    patch_presentation(original, {3: ("Nieuwe titel", ["Eerste punt", ("Tweede punt", "Subpunt")])}, patched)
+
+    assert_valid_package(patched)
+    assert unchanged_entries(original, patched, {"ppt/slides/slide3.xml"}) == []
+    slide = Presentation(patched).slides[2]
+    assert slide.shapes.title.text == "Nieuwe titel"
+    assert [p.text for p in slide.placeholders[1].text_frame.paragraphs] == ["Eerste punt", "Tweede punt", "Subpunt"]
+
+
+def test_patch_title_slide_takes_subtitle_string(tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    create_presentation(path)
+
+    patch_presentation(path, {1: ("Nieuwe titel", "Nieuwe ondertitel")})
+
+    assert_valid_package(path)
+    subtitle = Presentation(path).slides[0].placeholders[1].text_frame
+    assert [p.text for p in subtitle.paragraphs] == ["Nieuwe ondertitel"]
+
+
+def test_patch_playbook_round_trip(tmp_path):
+    original = str(tmp_path / "playbook.docx")
+    patched = str(tmp_path / "playbook-patched.docx")
+    create_playbook(original)
+
+    patch_playbook(original, {2: ("2. Agenda", "Nieuwe kern", ["Nieuw punt"], "0:45")}, patched)
+
+    assert_valid_package(patched)
+    assert unchanged_entries(original, patched, {"word/document.xml"}) == []
+    row = Document(patched).tables[0].rows[2]
+    assert row.cells[0].text == "2. Agenda"
+    assert "KERN: Nieuwe kern" in row.cells[1].text
+    assert row.cells[2].text == "0:45"
+
+
+@pytest.mark.parametrize("number", [0, -1, 14])
+def test_patch_presentation_rejects_unknown_slide(tmp_path, number):
+    path = str(tmp_path / "deck.pptx")
+    create_presentation(path)
+
+    with pytest.raises(ValueError):
+        patch_presentation(path, {number: ("Titel", ["Punt"])})
+
+
+@pytest.mark.parametrize("number", [0, -1, 14])
+def test_patch_playbook_rejects_unknown_row(tmp_path, number):
+    path = str(tmp_path / "playbook.docx")
+    create_playbook(path)
+
+    with pytest.raises(ValueError):
+        patch_playbook(path, {number: ("Slide", "Kern", [], "0:30")})
+
+
+def test_rewrite_package_in_place_leaves_no_temp_file(tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    create_presentation(path)
+
+    with pytest.raises(TypeError):
+        rewrite_package(path, {"ppt/slides/slide1.xml": None})
+
+    assert os.listdir(tmp_path) == ["deck.pptx"]
+    assert_valid_package(path)
@@ -0,0 +1,54 @@
+import os
+import zipfile
+
+import pytest
+from docx import Document
+from pptx import Presentation
+
+from package_writer import _compress_member, save_package
+
+# save_package drives the libraries' package writers through private methods;
+# these round trips catch a python-docx/python-pptx upgrade that changes them.
+
+
+def read_entries(path):
+    with zipfile.ZipFile(path) as z:
+        assert z.testzip() is None
+        return {info.filename: (z.read(info.filename), info.compress_type) for info in z.infolist()}
+
+
+@pytest.mark.parametrize("new, reopen, ext", [
+    (Document, Document, ".docx"),
+    (Presentation, Presentation, ".pptx"),
+])
+def test_save_package_matches_stock_save(tmp_path, new, reopen, ext):
+    doc = new()
+    stock = str(tmp_path / f"stock{ext}")
+    ours = str(tmp_path / f"ours{ext}")
+    doc.save(stock)
+    save_package(doc, ours)
+
+    stock_entries = read_entries(stock)
+    our_entries = read_entries(ours)
+    assert list(our_entries) == list(stock_entries)
+    assert {name: data for name, (data, _) in our_entries.items()} == {
+        name: data for name, (data, _) in stock_entries.items()
+    }
+    # No larger than the stock writer, which deflates everything
+    assert os.path.getsize(ours) <= os.path.getsize(stock) * 1.02
+    reopen(ours)
+
+
+def test_compressible_media_is_deflated(tmp_path):
+    path = str(tmp_path / "doc.docx")
+    save_package(Document(), path)
+
+    _, compress_type = read_entries(path)["docProps/thumbnail.jpeg"]
+    assert compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_incompressible_part_is_stored():
+    blob = os.urandom(200 * 1024)
+    info, _ = _compress_member("ppt/media/video1.mp4", blob, 6, (2026, 1, 1, 0, 0, 0))
+    assert info.compress_type == zipfile.ZIP_STORED
+    assert info.compress_size == len(blob)
@@ -0,0 +1,187 @@
+import functools
+import os
+import sys
+
+try:
+    from pptx.enum.text import MSO_AUTO_SIZE
+    from pptx.util import Emu, Pt
+except ImportError:
+    print("Error: 'python-pptx' module not found.")
+    print("Please install it using: pip install python-pptx")
+    sys.exit(1)
+
+try:
+    from PIL import ImageFont
+except ImportError:
+    print("Error: 'Pillow' module not found.")
+    print("Please install it using: pip install Pillow")
+    sys.exit(1)
+
+# Auto-fit for slide placeholders without python-pptx's fit_text, which opens
+# and measures the font file on every call (and cannot find fonts on Linux).
+# Glyph widths are measured once per font and size and cached; after that,
+# wrapping and picking the font size is plain arithmetic on those tables.
+
+FONT_DIRS = [
+    "/usr/share/fonts",
+    "/usr/local/share/fonts",
+    os.path.expanduser("~/.fonts"),
+    "/Library/Fonts",
+    "/System/Library/Fonts",
+    os.path.expanduser("~/Library/Fonts"),
+    os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+]
+
+# Default text frame insets of a placeholder (0.1" left/right, 0.05" top/bottom)
+INSET_X = Emu(91440)
+INSET_Y = Emu(45720)
+LINE_SPACING = 1.2
+LEVEL_INDENT = Pt(27)
+LEVEL_SIZE_STEP = 4
+
+# Level-1 body text size of the default template (p:bodyStyle on the master),
+# for placeholders whose inheritance chain sets no size at all
+DEFAULT_BODY_SIZE = 32
+LEVEL1_SIZE = "./p:txBody/a:lstStyle/a:lvl1pPr/a:defRPr/@sz"
+BODY_STYLE_SIZE = "./p:txStyles/p:bodyStyle/a:lvl1pPr/a:defRPr/@sz"
+
+
+@functools.lru_cache(maxsize=None)
+def find_font_file(family, bold=False):
+    wanted = family.lower().replace(" ", "")
+    suffixes = ("bd", "-bold", "bold") if bold else ("", "-regular", "regular")
+    for font_dir in FONT_DIRS:
+        if not os.path.isdir(font_dir):
+            continue
+        for root, _, files in os.walk(font_dir):
+            for name in files:
+                stem, ext = os.path.splitext(name)
+                if ext.lower() not in (".ttf", ".otf"):
+                    continue
+                if stem.lower().replace(" ", "") in (wanted + s for s in suffixes):
+                    return os.path.join(root, name)
+    return None
+
+
+class GlyphWidths:
+    """Advance widths (in points) of one font at one size."""
+
+    def __init__(self, font_file, size):
+        self.size = size
+        if font_file:
+            self._font = ImageFont.truetype(font_file, size * 10)
+        else:
+            # No font file found: Pillow's built-in scalable font is close enough
+            self._font = ImageFont.load_default(size * 10)
+        self._chars = {}
+        self._words = {}
+
+    def char(self, c):
+        width = self._chars.get(c)
+        if width is None:
+            width = self._chars[c] = self._font.getlength(c) / 10
+        return width
+
+    def word(self, w):
+        width = self._words.get(w)
+        if width is None:
+            width = self._words[w] = sum(self.char(c) for c in w)
+        return width
+
+
+@functools.lru_cache(maxsize=256)
+def glyph_widths(family, size, bold=False):
+    return GlyphWidths(find_font_file(family, bold), size)
+
+
+def count_lines(text, widths, max_width):
+    # Greedy word wrap, the same way PowerPoint breaks lines
+    space = widths.char(" ")
+    lines = 0
+    for segment in text.splitlines() or [""]:
+        lines += 1
+        line_width = 0
+        for word in segment.split():
+            w = widths.word(word)
+            if line_width and line_width + space + w > max_width:
+                lines += 1
+                line_width = w
+            else:
+                line_width += (space if line_width else 0) + w
+    return lines
+
+
+def level_size(size, level, min_size):
+    return max(size - LEVEL_SIZE_STEP * level, min_size)
+
+
+def inherited_size(placeholders, master=None):
+    """Level-1 font size (pt) of a body placeholder.
+
+    ``placeholders`` are the p:sp elements of the placeholder on the slide,
+    layout and master, nearest first; ``master`` is the p:sldMaster element
+    whose body style applies when none of them sets a size.
+    """
+    for sp in placeholders:
+        for sz in sp.xpath(LEVEL1_SIZE):
+            return int(sz) // 100
+    if master is not None:
+        for sz in master.xpath(BODY_STYLE_SIZE):
+            return int(sz) // 100
+    return DEFAULT_BODY_SIZE
+
+
+def placeholder_size(shape):
+    """Level-1 font size (pt) ``shape`` inherits from its layout and master."""
+    placeholders = []
+    placeholder = shape
+    while placeholder is not None:
+        placeholders.append(placeholder._element)
+        placeholder = getattr(placeholder, "_base_placeholder", None)
+    return inherited_size(placeholders, shape.part.slide_layout.slide_master._element)
+
+
+def best_fit_size(paragraphs, width, height, family="Calibri", max_size=DEFAULT_BODY_SIZE, min_size=10):
+    """Largest font size (pt) at which all (text, level) paragraphs fit the box.
+
+    ``width`` and ``height`` are in EMU, like shape dimensions.
+    Returns ``min_size`` if even that does not fit.
+    """
+    box_width = Emu(width - 2 * INSET_X).pt
+    box_height = Emu(height - 2 * INSET_Y).pt
+    for size in range(max_size, min_size - 1, -1):
+        total = 0
+        for text, level in paragraphs:
+            para_size = level_size(size, level, min_size)
+            widths = glyph_widths(family, para_size)
+            lines = count_lines(text, widths, box_width - LEVEL_INDENT.pt * level)
+            total += lines * para_size * LINE_SPACING
+            if total > box_height:
+                break
+        if total <= box_height:
+            return size
+    return min_size
+
+
+def fit_text_frame(shape, family="Calibri", max_size=None, min_size=10, extent=None):
+    """Shrink the text in ``shape`` if it overflows, and return the chosen size.
+
+    ``max_size`` defaults to the size the placeholder inherits; text that fits
+    at that size is left as it is. ``extent`` and ``max_size`` can be passed
+    for shapes whose layout is not loaded, as (width, height) in EMU and pt.
+    """
+    tf = shape.text_frame
+    tf.word_wrap = True
+    tf.auto_size = MSO_AUTO_SIZE.NONE
+    if max_size is None:
+        max_size = placeholder_size(shape)
+    paragraphs = [(p.text, p.level) for p in tf.paragraphs]
+    width, height = extent or (shape.width, shape.height)
+    size = best_fit_size(paragraphs, width, height, family, max_size, min_size)
+    if size == max_size:
+        return size
+    for p in tf.paragraphs:
+        para_size = Pt(level_size(size, p.level, min_size))
+        for run in p.runs:
+            run.font.size = para_size
+    return size